@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import collections
+import functools
 import getpass
 import glob
 import os
@@ -6,7 +8,7 @@ import pathlib
 import shutil
 import subprocess
 import sys
-import unittest
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 if os.path.abspath(sys.argv[0]) == os.path.abspath(__file__):
@@ -150,7 +152,12 @@ def install_completion(
         else:
             confirm(f"File exists. Overwrite?", abort_on_unconfirmed=True)
 
-    _copy_file(source, destination, template=template_type, context=template_context)
+    if template_type:
+        _copy_file(
+            source, destination, template=template_type, context=template_context
+        )
+    else:
+        shutil.copy(source, destination)
     printer.info(f"Installed; remember to:\n    source {destination}")
 
 
@@ -159,6 +166,7 @@ def test(
     *tests,
     fail_fast=False,
     verbosity=1,
+    parallel: arg(help="Run test modules in parallel") = False,
     with_coverage: arg(short_option="-c") = True,
     with_lint: arg(short_option="-l") = True,
 ):
@@ -173,27 +181,61 @@ def test(
         coverage_message = " with coverage" if with_coverage else ""
         printer.hr(f"Running tests{coverage_message}")
 
+    import unittest
+
     runner = unittest.TextTestRunner(failfast=fail_fast, verbosity=verbosity)
     loader = unittest.TestLoader()
+    source_dir = str(top_level_dir / "src/runcommands")
+
+    # Coverage is only reported when running the full suite.
+    measure_coverage = with_coverage and not tests
+
+    if measure_coverage:
+        Coverage = _get_coverage_class()
+        # In parallel mode, each test process writes its own data file,
+        # and they're combined afterwards. data_suffix=True puts this
+        # instance in parallel mode too, so erase() also removes data
+        # files left over from earlier runs that didn't get combined.
+        coverage = Coverage(source=[source_dir], data_suffix=parallel)
+        if parallel:
+            coverage.erase()
+        else:
+            coverage.start()
 
-    if with_coverage:
-        from coverage import Coverage
-
-        source_dir = str(top_level_dir / "src/runcommands")
-        coverage = Coverage(source=[source_dir])
-        coverage.start()
-
-    if tests:
-        sys.path.insert(0, str(top_level_dir))
-        runner.run(loader.loadTestsFromNames(tests))
+    if parallel:
+        if tests:
+            names = list(tests)
+        else:
+            tests_dir = top_level_dir / "tests"
+            names = [
+                ".".join(path.relative_to(top_level_dir).with_suffix("").parts)
+                for path in sorted(tests_dir.rglob("test*.py"))
+            ]
+        coverage_source = source_dir if measure_coverage else None
+        succeeded = _run_tests_in_parallel(
+            names, top_level_dir, fail_fast, verbosity, coverage_source
+        )
     else:
-        tests_dir = str(top_level_dir / "tests")
+        if tests:
+            # Only add the project root once, so repeated runs in the
+            # same process don't keep growing sys.path.
+            if str(top_level_dir) not in sys.path:
+                sys.path.insert(0, str(top_level_dir))
+            suite = loader.loadTestsFromNames(tests)
+        else:
+            tests_dir = top_level_dir / "tests"
+            suite = loader.discover(str(tests_dir), top_level_dir=str(top_level_dir))
+        # Same rule as a test process's exit code in parallel mode.
+        succeeded = runner.run(suite).wasSuccessful()
+
+    if not tests:
         top_level_dir = str(top_level_dir)
-        tests = loader.discover(tests_dir, top_level_dir=top_level_dir)
-        result = runner.run(tests)
-        if not result.errors:
-            if with_coverage:
-                coverage.stop()
+        if succeeded:
+            if measure_coverage:
+                if parallel:
+                    coverage.combine()
+                else:
+                    coverage.stop()
                 coverage.report()
             if with_lint:
                 # XXX: The test runner apparently changes CWD.
@@ -211,25 +253,22 @@ def tox(
     clean: "Remove tox directory first" = False,
 ):
     if clean:
-        local("rm -rf .tox", echo=True)
-    local(
-        (
-            "tox",
-            ("-e", ",".join(envs)) if envs else None,
-            "--recreate" if recreate else None,
-        )
-    )
+        rmdir(".tox", verbose=True)
+    argv = ["tox"]
+    if envs:
+        argv += ["-e", ",".join(envs)]
+    if recreate:
+        argv.append("--recreate")
+    local(argv)
 
 
 @command
 def format_code(check=False, where="./"):
+    argv = ["black"]
     if check:
-        check_arg = "--check"
-        raise_on_error = False
-    else:
-        check_arg = None
-        raise_on_error = True
-    result = local(("black", check_arg, where), raise_on_error=raise_on_error)
+        argv.append("--check")
+    argv.append(where)
+    result = local(argv, raise_on_error=not check)
     return result
 
 
@@ -239,17 +278,21 @@ def lint(
     disable_ignore: arg(no_inverse=True, help="Don't ignore any errors") = False,
     disable_noqa: arg(no_inverse=True, help="Ignore noqa directives") = False,
 ):
-    result = local(
-        (
-            "flake8",
-            ".",
-            "--ignore=" if disable_ignore else None,
-            "--disable-noqa" if disable_noqa else None,
-        ),
-        stdout="capture",
-        raise_on_error=False,
-    )
-    pieces_of_lint = len(result.stdout_lines)
+    # Stream output rather than capturing it all so large amounts of
+    # lint don't have to be held in memory just to be counted.
+    argv = ["flake8", "."]
+    if disable_ignore:
+        argv.append("--ignore=")
+    if disable_noqa:
+        argv.append("--disable-noqa")
+    process = local(argv, background=True, stdout="capture")
+    pieces_of_lint = 0
+    errors = collections.deque(maxlen=200) if show_errors else None
+    with process:
+        for line in process.stdout:
+            pieces_of_lint += 1
+            if show_errors:
+                errors.append(line)
     if pieces_of_lint:
         ess = "" if pieces_of_lint == 1 else "s"
         colon = ":" if show_errors else ""
@@ -257,7 +300,9 @@ def lint(
             f"{pieces_of_lint} piece{ess} of lint found{colon}",
         ]
         if show_errors:
-            message.append(result.stdout.rstrip())
+            if pieces_of_lint > len(errors):
+                message.append(f"(showing last {len(errors)})")
+            message.append("".join(errors).rstrip())
         message = "\n".join(message)
         abort(1, message)
     else:
@@ -284,27 +329,13 @@ def clean(verbose=False, more=False):
     Skips hidden directories.
 
     """
-    root = os.getcwd()
-
     rmdir("build", verbose)
     rmdir("dist", verbose)
 
-    for path, dirs, files in os.walk(root):
-        rel_path = os.path.relpath(path, root)
-
-        if rel_path == ".":
-            rel_path = ""
-
-        if rel_path.startswith("."):
-            continue
-
-        for d in dirs:
-            if d == "__pycache__":
-                rmdir(os.path.join(rel_path, d))
-
-        for f in files:
-            if f.endswith(".pyc") or f.endswith(".pyo"):
-                rmfile(os.path.join(rel_path, f), verbose)
+    if os.name == "posix" and shutil.which("find"):
+        _remove_python_cache_with_find(verbose)
+    else:
+        _remove_python_cache(verbose)
 
     if more:
         rmdir(".venv", verbose)
@@ -427,24 +458,185 @@ def upload_dists(
 # Utilities
 
 
+@functools.lru_cache(maxsize=None)
+def _get_coverage_class():
+    from coverage import Coverage
+
+    return Coverage
+
+
+def _run_tests_in_parallel(names, top_level_dir, fail_fast, verbosity, coverage_source):
+    """Run each test module in its own process.
+
+    When ``coverage_source`` is specified, each process records its
+    coverage data separately; the data files need to be combined
+    afterwards.
+
+    Returns ``True`` if all the test processes succeeded.
+
+    """
+    if coverage_source:
+        runner = (
+            (sys.executable, "-m", "coverage", "run", "--parallel-mode"),
+            (f"--source={coverage_source}", "-m", "unittest"),
+        )
+    else:
+        runner = (sys.executable, "-m", "unittest")
+
+    if verbosity < 1:
+        verbosity_arg = "--quiet"
+    elif verbosity > 1:
+        verbosity_arg = "--verbose"
+    else:
+        verbosity_arg = None
+
+    def run_module(name):
+        args = (runner, "--failfast" if fail_fast else None, verbosity_arg, name)
+        return local(
+            args,
+            cd=str(top_level_dir),
+            stdout="capture",
+            stderr="capture",
+            raise_on_error=False,
+        )
+
+    max_workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(run_module, names))
+
+    # Show output in module order once everything has finished so the
+    # output from different modules isn't interleaved.
+    for name, result in zip(names, results):
+        printer.info(name)
+        print(result.stdout or "", end="")
+        print(result.stderr or "", end="", file=sys.stderr)
+
+    return all(results)
+
+
+def _remove_python_cache_with_find(verbose=False):
+    """Remove Python cache files using a single ``find`` process.
+
+    This is *much* faster than walking the tree in Python, especially
+    for large trees.
+
+    """
+    if verbose:
+        # Use the same output format as _remove_python_cache().
+        print_dirs = ("-exec", "printf", "Removed directory: %s\\n", "{}", "+")
+        print_files = ("-exec", "printf", "Removed file: %s\\n", "{}", "+")
+    else:
+        print_dirs = print_files = None
+    result = local(
+        (
+            "find",
+            ".",
+            # Skip hidden entries at every level (but not . itself).
+            ("-mindepth", "1", "-name", ".*", "-prune"),
+            ("-o", "-type", "d", "-name", "__pycache__", "-prune"),
+            ("-exec", "rm", "-rf", "{}", "+", print_dirs),
+            ("-o", "-type", "f", "-name", "*.py[co]"),
+            ("-exec", "rm", "-f", "{}", "+", print_files),
+        ),
+        stdout="capture",
+        stderr="capture",
+        # find exits with status 1 when it can't read a directory; skip
+        # those and keep going, like os.walk() does.
+        raise_on_error=False,
+    )
+    if verbose and result.stdout:
+        printer.info(result.stdout.rstrip())
+    if result.failed:
+        printer.warning(result.stderr.rstrip() or "find failed")
+
+
+def _remove_python_cache(verbose=False):
+    # Collect everything first so removal can happen concurrently. This
+    # is I/O bound, so threads help despite the GIL.
+    found = list(_scan(os.curdir))
+    if found:
+        max_workers = min(8, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for path, is_dir in found:
+                if is_dir:
+                    future = executor.submit(_rmtree, path)
+                    futures[future] = ("directory", path)
+                else:
+                    future = executor.submit(_unlink, path)
+                    futures[future] = ("file", path)
+            removed = []
+            for future in as_completed(futures):
+                future.result()
+                if verbose:
+                    removed.append(futures[future])
+        # Log from the main thread only, and all at once, since printing
+        # each removal separately can dominate the run time when there
+        # are a lot of files.
+        if removed:
+            printer.info("\n".join(f"Removed {kind}: {path}" for kind, path in removed))
+
+
+def _scan(path):
+    """Find __pycache__ directories and .py[co] files under path.
+
+    Yields ``(path, is_dir)`` pairs. Each entry is classified once in
+    a single pass so callers don't need to check its type again.
+
+    Hidden entries and symlinks are skipped. The type info cached on
+    each :class:`os.DirEntry` is used so no extra stat calls are made.
+
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(".") or entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if name == "__pycache__":
+                    yield entry.path, True
+                else:
+                    yield from _scan(entry.path)
+            elif name.endswith((".pyc", ".pyo")):
+                yield entry.path, False
+
+
+def _rmtree(path):
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        pass
+
+
+def _unlink(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
 def rmfile(name, verbose=False):
-    if os.path.isfile(name):
+    try:
         os.remove(name)
+    except (FileNotFoundError, IsADirectoryError):
+        # As before, a directory with this name isn't touched.
         if verbose:
-            printer.info("Removed file:", name)
+            printer.info("File not present:", name)
     else:
         if verbose:
-            printer.info("File not present:", name)
+            printer.info("Removed file:", name)
 
 
 def rmdir(name, verbose=False):
-    if os.path.isdir(name):
+    try:
         shutil.rmtree(name)
+    except (FileNotFoundError, NotADirectoryError):
+        # As before, a file with this name isn't touched.
         if verbose:
-            printer.info("Removed directory:", name)
+            printer.info("Directory not present:", name)
     else:
         if verbose:
-            printer.info("Directory not present:", name)
+            printer.info("Removed directory:", name)
 
 
 if __name__ == "__main__":
@@ -6,10 +6,8 @@ from enum import Enum
 from functools import update_wrapper
 from inspect import Parameter as BaseParameter
 
-from cached_property import cached_property
-
 from .exc import CommandError
-from .util import invert_string, is_mapping, is_sequence, is_type
+from .util import cached_property, invert_string, is_mapping, is_sequence, is_type
 
 EMPTY = BaseParameter.empty
 KEYWORD_ONLY = BaseParameter.KEYWORD_ONLY
@@ -18,6 +16,19 @@ POSITIONAL_OR_KEYWORD = BaseParameter.POSITIONAL_OR_KEYWORD
 VAR_KEYWORD = BaseParameter.VAR_KEYWORD
 VAR_POSITIONAL = BaseParameter.VAR_POSITIONAL
 
+# String values accepted for bool args in config files
+_TRUE_VALUES = frozenset(("1", "true"))
+_FALSE_VALUES = frozenset(("0", "false"))
+
+# (is_bool, is_bool_or, is_enum_bool_or, is_enum) for the most common
+# arg types so they don't have to go through the issubclass() checks.
+_TYPE_FLAGS = {
+    bool: (True, False, False, False),
+    float: (False, False, False, False),
+    int: (False, False, False, False),
+    str: (False, False, False, False),
+}
+
 
 class POSITIONAL_PLACEHOLDER:
 
@@ -39,42 +50,33 @@ class Parameter:
     VAR_KEYWORD = VAR_KEYWORD
     VAR_POSITIONAL = VAR_POSITIONAL
 
+    # NOTE: There's one of these per parameter per command, so slots
+    #       are used to keep them small. The flags are cheap to compute,
+    #       so they're computed up front instead of being cached.
+    __slots__ = (
+        "parameter",
+        "is_positional",
+        "is_var_positional",
+        "is_var_keyword",
+        "is_optional",
+        "is_required_keyword_only",
+        "is_bool",
+    )
+
     def __init__(self, parameter):
+        kind = parameter.kind
+        default = parameter.default
         self.parameter = parameter
-
-    @cached_property
-    def is_positional(self):
-        kind = self.parameter.kind
-        default = self.parameter.default
-        return (kind is POSITIONAL_ONLY) or (
+        self.is_positional = (kind is POSITIONAL_ONLY) or (
             kind is POSITIONAL_OR_KEYWORD and default is EMPTY
         )
-
-    @cached_property
-    def is_var_positional(self):
-        return self.parameter.kind is VAR_POSITIONAL
-
-    @cached_property
-    def is_var_keyword(self):
-        return self.parameter.kind is VAR_KEYWORD
-
-    @cached_property
-    def is_optional(self):
-        kind = self.parameter.kind
-        default = self.parameter.default
-        return (
+        self.is_var_positional = kind is VAR_POSITIONAL
+        self.is_var_keyword = kind is VAR_KEYWORD
+        self.is_optional = (
             (kind is POSITIONAL_OR_KEYWORD) or (kind is KEYWORD_ONLY)
         ) and default is not EMPTY
-
-    @cached_property
-    def is_required_keyword_only(self):
-        kind = self.parameter.kind
-        default = self.parameter.default
-        return kind is KEYWORD_ONLY and default is EMPTY
-
-    @cached_property
-    def is_bool(self):
-        return isinstance(self.parameter.default, bool)
+        self.is_required_keyword_only = kind is KEYWORD_ONLY and default is EMPTY
+        self.is_bool = isinstance(default, bool)
 
     def __getattr__(self, name):
         """Proxy to wrapped :class:`inspect.Parameter`."""
@@ -122,7 +124,6 @@ class ArgConfig:
 
     """
 
-    short_option_regex = re.compile(r"-\w")
     long_option_regex = re.compile(r"--\w+(-\w+)*")
 
     def __init__(
@@ -145,7 +146,13 @@ class ArgConfig:
         default=EMPTY,
     ):
         if short_option is not None:
-            if not self.short_option_regex.fullmatch(short_option):
+            # Equivalent to matching -\w but cheaper than a regex.
+            is_short_option = (
+                len(short_option) == 2
+                and short_option[0] == "-"
+                and (short_option[1].isalnum() or short_option[1] == "_")
+            )
+            if not is_short_option:
                 raise CommandError(
                     f'Expected short option with form -x, not "{short_option}"'
                 )
@@ -288,7 +295,11 @@ class Arg:
             else:
                 type = str
 
-        if isinstance(type, builtins.type):
+        type_flags = _TYPE_FLAGS.get(type)
+
+        if type_flags is not None:
+            is_bool, is_bool_or, is_enum_bool_or, is_enum = type_flags
+        elif isinstance(type, builtins.type):
             is_bool = issubclass(type, bool)
             is_bool_or = issubclass(type, bool_or)
             is_enum_bool_or = is_bool_or and issubclass(type, Enum)
@@ -435,28 +446,47 @@ class Arg:
         else:
             inverse_help = self.help
 
-        kwargs = kwargs.copy()
+        # The inverse option is a plain flag, so it doesn't take any of
+        # the value-related args a bool_or option does.
+        if self.is_bool_or:
+            excluded = ("action", "help", "metavar", "nargs", "type")
+        else:
+            excluded = ("action", "help")
+
+        kwargs = {k: v for k, v in kwargs.items() if k not in excluded}
         kwargs["action"] = "store_false"
         kwargs["help"] = inverse_help
 
-        if self.is_bool_or:
-            kwargs.pop("metavar")
-            kwargs.pop("nargs")
-            kwargs.pop("type")
-
         return args, kwargs
 
-    def convert_value(self, value: str):
-        """Convert string value to this arg's type."""
+    def convert_value(self, value: str, *, split_items=False):
+        """Convert string value to this arg's type.
+
+        If ``split_items`` is set, container values are split into
+        items on whitespace. This is for INI files (i.e., setup.cfg),
+        where there's no other way to specify a list or dict.
+
+        """
         if not isinstance(value, str):
             return value
         if self.is_bool or self.is_bool_or:
-            if value in ("1", "true"):
+            if value in _TRUE_VALUES:
                 return True
-            elif value in ("0", "false"):
+            elif value in _FALSE_VALUES:
                 return False
             if self.is_bool:
                 raise ValueError(f"Bool value must be one of 1, true, 0, or false")
+        if split_items and self.container and not self.is_bool_or:
+            # Container values are given as whitespace-separated items
+            # (which may be split across lines), like "a b c" or, for
+            # dicts, "a:1 b:2".
+            return add_items_to_container(
+                self.container,
+                self.type,
+                self.container(),
+                value.split(),
+                self.name,
+            )
         converter = self.add_argument_args[1]["type"]
         value = converter(value)
         return value
@@ -635,10 +665,13 @@ class ContainerAction(argparse.Action):
         return type("ContainerAction", (cls,), {"container_type": container_type})
 
     def __call__(self, parser, namespace, values, option_string=None):
+        existing_items = getattr(namespace, self.dest, None)
+        if existing_items is None:
+            existing_items = self.container_type()
         items = add_items_to_container(
             self.container_type,
             self.type,
-            getattr(namespace, self.dest, self.container_type()),
+            existing_items,
             values,
             option_string,
         )
@@ -2,20 +2,17 @@ import argparse
 import inspect
 import signal
 import sys
+import textwrap
 import time
-from collections import OrderedDict
-from configparser import ConfigParser, ExtendedInterpolation
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISREG
 from typing import Mapping
 
-from cached_property import cached_property
-
-import toml
-
 from .args import POSITIONAL_PLACEHOLDER, Arg, ArgConfig, HelpArg, Parameter
 from .exc import CommandError, RunAborted, RunCommandsError
 from .result import Result
-from .util import camel_to_underscore, is_type, printer, Data
+from .util import cached_property, camel_to_underscore, is_type, printer, Data
 
 
 __all__ = ["command", "subcommand", "Command"]
@@ -184,7 +181,7 @@ class Command:
         description = description or self.get_description_from_docstring(
             self.implementation
         )
-        short_description = description.splitlines()[0] if description else None
+        short_description = description.partition("\n")[0] if description else None
 
         if sources and not creates:
             raise ValueError(
@@ -213,6 +210,8 @@ class Command:
         self.base_name = base_name
         self.is_subcommand = is_subcommand
         self.subcommands = []
+        # Subcommands keyed by base name, for direct lookup of argv items
+        self.subcommand_map = {}
         self.first_arg = first_arg
         self.first_arg_has_choices = (
             False if first_arg is None else bool(first_arg.choices)
@@ -299,28 +298,37 @@ class Command:
             ``commands.toml`` instead.
 
         .. note:: The first time a config file is loaded, its contents
-            are cached to reduce file reads.
+            are cached to reduce file reads. The cache is keyed on the
+            file's path, modification time, and size, so changes to the
+            file will be picked up.
 
         """
+        # These are only needed when reading config, so defer importing
+        # them to keep them off the import path for defining commands.
+        from configparser import ConfigParser, ExtendedInterpolation
+
+        import toml
+
         cwd = Path.cwd()
         pyproject_file = cwd / "pyproject.toml"
         setup_file = cwd / "setup.cfg"
 
-        if pyproject_file not in _cache:
-            if pyproject_file.is_file():
-                all_config = toml.load(pyproject_file)
-            else:
-                all_config = None
-            _cache[pyproject_file] = all_config
+        pyproject_key = _config_file_cache_key(pyproject_file)
 
-        all_config = _cache[pyproject_file]
+        if pyproject_key is None:
+            all_config = None
+        elif pyproject_key in _cache:
+            all_config = _cache[pyproject_key]
+        else:
+            all_config = toml.load(pyproject_file)
+            _cache[pyproject_key] = all_config
 
         if all_config is not None:
             tool_config = all_config.get("tool") or {}
-            candidates = [f"runcommands.{self.name}", self.name]
-            for candidate in candidates:
+            name_path = tuple(self.name.split("."))
+            candidates = (("runcommands",) + name_path, name_path)
+            for path in candidates:
                 config = tool_config
-                path = candidate.split(".")
                 for segment in path:
                     if segment in config:
                         config = config[segment]
@@ -330,27 +338,39 @@ class Command:
                     args = config.get("args")
                     return self.convert_config_file_args(pyproject_file, args)
 
-        if setup_file not in _cache:
-            if setup_file.is_file():
-                parser = ConfigParser(interpolation=ExtendedInterpolation())
-                parser.read(setup_file)
-                sections = parser.sections()
-            else:
-                sections = None
-            _cache[setup_file] = sections
+        setup_key = _config_file_cache_key(setup_file)
 
-        sections = _cache[setup_file]
+        if setup_key is None:
+            sections = None
+        elif setup_key in _cache:
+            sections = _cache[setup_key]
+        else:
+            parser = ConfigParser(interpolation=ExtendedInterpolation())
+            parser.read(setup_file)
+            # Resolve only the args sections (the rest of setup.cfg is
+            # typically config for other tools), each to a plain dict
+            # once so lookups for other commands don't go through the
+            # parser again. Other sections are still available for
+            # interpolation.
+            sections = {
+                name: dict(parser[name])
+                for name in parser.sections()
+                if name.endswith(".args")
+            }
+            _cache[setup_key] = sections
 
         if sections is not None:
-            candidates = [f"runcommands.{self.name}.args", f"{self.name}.args"]
+            candidates = (f"runcommands.{self.name}.args", f"{self.name}.args")
             for candidate in candidates:
                 if candidate in sections:
                     args = sections[candidate]
-                    return self.convert_config_file_args(setup_file, args)
+                    return self.convert_config_file_args(
+                        setup_file, args, split_items=True
+                    )
 
         return {}
 
-    def convert_config_file_args(self, config_file, args):
+    def convert_config_file_args(self, config_file, args, *, split_items=False):
         if not args:
             return {}
 
@@ -364,7 +384,7 @@ class Command:
                     f"{config_file.name}: {name}"
                 )
             try:
-                value = arg.convert_value(value)
+                value = arg.convert_value(value, split_items=split_items)
             except (ValueError, TypeError):
                 raise CommandError(
                     f"Could not convert value for command {self.name} "
@@ -407,6 +427,7 @@ class Command:
     def add_subcommand(self, subcommand):
         name = subcommand.base_name
         self.subcommands.append(subcommand)
+        self.subcommand_map[name] = subcommand
         if not self.first_arg_has_choices:
             if self.first_arg.choices is None:
                 self.first_arg.choices = []
@@ -414,16 +435,21 @@ class Command:
 
     def get_description_from_docstring(self, implementation):
         description = implementation.__doc__
-        if description is not None:
-            description = description.strip() or None
-        if description is not None:
-            lines = description.splitlines()
-            title = lines[0]
-            if title.endswith("."):
-                title = title[:-1]
-            lines = [title] + [line[4:] for line in lines[1:]]
-            description = "\n".join(lines)
-        return description
+        if description is None:
+            return None
+        description = description.strip()
+        if not description:
+            return None
+        title, newline, rest = description.partition("\n")
+        if title.endswith("."):
+            title = title[:-1]
+        if not newline:
+            # Fast path for one-line docstrings.
+            return title
+        # Remove the docstring's indentation, whatever it is, rather
+        # than assuming it's exactly four spaces.
+        rest = textwrap.dedent(rest)
+        return f"{title}\n{rest}"
 
     def add_callback(self, callback):
         self.callbacks.append(callback)
@@ -492,7 +518,7 @@ class Command:
 
         empty = Parameter.empty
         debug = self.debug
-        positionals = self.positionals
+        positional_params = self.positional_params
         var_positional = self.var_positional
         default_args = self.default_args
 
@@ -531,16 +557,15 @@ class Command:
         # passed positionally, using defaults for positionals that
         # weren't passed. Nothing special needs to be done for optional
         # args.
-        for arg in positionals.values():
-            name = arg.parameter.name
+        for name, default in positional_params:
             value = kwargs.pop(name, POSITIONAL_PLACEHOLDER)
             if value is POSITIONAL_PLACEHOLDER:
                 if name in default_args:
                     value = default_args[name]
                     if debug:
                         from_default_args[name] = value
-                elif arg.default is not empty:
-                    value = arg.default
+                elif default is not empty:
+                    value = default
                     if debug:
                         from_arg_defaults[name] = value
                 else:
@@ -676,13 +701,40 @@ class Command:
             return_code = 0
         return result, return_code
 
+    def _takes_only_subcommand_name(self):
+        """Check whether the subcommand name is all this command needs.
+
+        This is the case when the first arg is a plain positional that
+        the subcommand name can be assigned to as is and every other
+        positional has a default.
+
+        """
+        first_arg = self.first_arg
+        default_args = self.default_args
+        if (
+            first_arg is None
+            or not first_arg.is_positional
+            or self.first_arg_has_choices
+            or first_arg.action is not None
+            or first_arg.nargs not in (None, "?")
+            or first_arg.type not in (None, str)
+            or first_arg.parameter.name in default_args
+        ):
+            return False
+        if self.var_positional is not None:
+            return False
+        for name, default in self.positional_params[1:]:
+            if default is Parameter.empty and name not in default_args:
+                return False
+        return True
+
     def partition_subcommands(self, argv, base=True):
         debug = self.debug
         base_argv = []
         base_args = {}
         subcmd_args = {}
         commands = [(self, base_args)]
-        subcommand_map = {sub.name: sub for sub in self.subcommands}
+        subcommand_map = self.subcommand_map
 
         if debug:
             printer.debug("Parsing command for subcommands:", self.name)
@@ -693,10 +745,9 @@ class Command:
                 base_argv.append(arg[1:])
             else:
                 base_argv.append(arg)
-                qualified_name = f"{self.name}:{arg}"
+                subcmd = subcommand_map.get(arg)
 
-                if qualified_name in subcommand_map:
-                    subcmd = subcommand_map[qualified_name]
+                if subcmd is not None:
                     remaining_argv = argv[i + 1 :]
 
                     if debug:
@@ -704,7 +755,13 @@ class Command:
                         printer.debug("    Base argv:", base_argv)
                         printer.debug("    Remaining argv:", remaining_argv)
 
-                    base_args.update(self.parse_args(base_argv))
+                    if len(base_argv) == 1 and self._takes_only_subcommand_name():
+                        # Only the subcommand name was passed, so it can
+                        # be set directly without building this base
+                        # command's arg parser.
+                        base_args[self.first_arg.dest] = arg
+                    else:
+                        base_args.update(self.parse_args(base_argv))
 
                     if subcmd.is_base_command:
                         commands.extend(
@@ -775,15 +832,19 @@ class Command:
     def __call__(self, *passed_args, **passed_kwargs):
         empty = Parameter.empty
         debug = self.debug
-        positionals = tuple(self.positionals.values())
-        num_positionals = len(positionals)
+        positional_params = self.positional_params
+        num_positionals = len(positional_params)
         var_positional = self.var_positional
         default_args = self.default_args
 
         num_passed_args = len(passed_args)
         args = []
         var_args = ()
-        kwargs = passed_kwargs.copy()
+
+        # passed_kwargs is a fresh dict built for this call, so it only
+        # needs to be copied when defaults will be added to it below.
+        # (The original is kept intact for the debug output.)
+        kwargs = passed_kwargs.copy() if default_args else passed_kwargs
 
         if debug:
             # Positional args passed (name, value pairs).
@@ -797,8 +858,7 @@ class Command:
 
         # The N passed positional args are mapped to the first N
         # positional parameters.
-        for arg, value in zip(positionals, passed_args):
-            name = arg.parameter.name
+        for (name, _), value in zip(positional_params, passed_args):
             args.append((name, value))
             if debug:
                 args_passed.append((name, value))
@@ -806,15 +866,14 @@ class Command:
         # Use defaults for positionals that weren't passed. This is done
         # here instead of below with the optionals so they'll be passed
         # positionally.
-        for arg in positionals[len(args) :]:
-            name = arg.parameter.name
+        for name, default in positional_params[len(args) :]:
             if name in default_args:
                 value = default_args[name]
                 args.append((name, value))
                 if debug:
                     from_default_args[name] = value
-            elif arg.default is not empty:
-                value = arg.default
+            elif default is not empty:
+                value = default
                 args.append((name, value))
                 if debug:
                     from_arg_defaults[name] = value
@@ -846,13 +905,15 @@ class Command:
         # Use defaults for any optionals that weren't passed that have a
         # default. Positionals that weren't passed have already had
         # their defaults set above.
-        arg_names = tuple(item[0] for item in args)
-        get_from_default_args = set(default_args).difference(arg_names, passed_kwargs)
-        for name in get_from_default_args:
-            value = default_args[name]
-            kwargs[name] = value
-            if debug:
-                from_default_args[name] = value
+        if default_args:
+            arg_names = tuple(item[0] for item in args)
+            get_from_default_args = default_args.keys() - passed_kwargs.keys()
+            get_from_default_args.difference_update(arg_names)
+            for name in get_from_default_args:
+                value = default_args[name]
+                kwargs[name] = value
+                if debug:
+                    from_default_args[name] = value
 
         if debug:
             var_args_display = (var_args_name, tuple(var_args)) if var_args else ()
@@ -879,11 +940,7 @@ class Command:
         if expand_short_options:
             argv = self.expand_short_options(argv)
         parsed_args = self.arg_parser.parse_args(argv)
-        parsed_args = vars(parsed_args)
-        for k, v in parsed_args.items():
-            if v == "":
-                parsed_args[k] = None
-        return parsed_args
+        return {k: (None if v == "" else v) for k, v in vars(parsed_args).items()}
 
     def parse_optional(self, string):
         """Parse string into name, option, and value (if possible).
@@ -928,10 +985,23 @@ class Command:
         """
         if self.debug:
             printer.debug(f"Expanding short options for `{self.name}`: {argv}")
-        has_multi_short_options = False
+        # Find the first arg that looks like a multi short option. In
+        # the common case, there isn't one, and argv is returned as is
+        # without being rebuilt.
+        for start, arg in enumerate(argv):
+            if arg == "--":
+                break
+            if len(arg) > 2 and arg[0] == "-" and arg[1] != "-" and arg[2] != "=":
+                break
+        else:
+            start = None
+        if start is None or argv[start] == "--":
+            if self.debug:
+                printer.debug("No multi short options found")
+            return argv
         parse_multi_short_option = self.parse_multi_short_option
-        new_argv = []
-        for i, arg in enumerate(argv):
+        new_argv = list(argv[:start])
+        for i, arg in enumerate(argv[start:], start):
             if arg == "--":
                 new_argv.extend(argv[i:])
                 break
@@ -940,12 +1010,9 @@ class Command:
                 new_argv.extend(short_options)
                 if value is not None:
                     new_argv.append(value)
-                has_multi_short_options = True
             else:
                 new_argv.append(arg)
-        if self.debug and not has_multi_short_options:
-            printer.debug("No multi short options found")
-        return new_argv if has_multi_short_options else argv
+        return new_argv
 
     def parse_multi_short_option(self, arg):
         """Parse args like '-xyz' into ['-x', '-y', '-z'].
@@ -990,21 +1057,11 @@ class Command:
 
     @staticmethod
     def normalize_name(name):
-        # Chomp a single trailing underscore *if* the name ends with
-        # just one trailing underscore. This accommodates the convention
-        # of adding a trailing underscore to reserved/built-in names.
-        if name.endswith("_"):
-            if name[-2] != "_":
-                name = name[:-1]
-        name = name.replace("_", "-")
-        return name
+        return _normalize_name(name)
 
     @staticmethod
     def normalize_class_name(name):
-        name = camel_to_underscore(name)
-        name = name.replace("_", "-")
-        name = name.lower()
-        return name
+        return _normalize_class_name(name)
 
     def find_arg(self, name):
         """Find arg by normalized arg name or parameter name."""
@@ -1083,21 +1140,37 @@ class Command:
     @cached_property
     def parameters(self):
         implementation = self.implementation
-        signature = inspect.signature(implementation)
-        parameters = OrderedDict()
+        signature = _get_signature(implementation)
+        parameters = {}
+        has_kwargs = False
         for name, param in signature.parameters.items():
-            parameters[name] = Parameter(param)
+            param = Parameter(param)
+            parameters[name] = param
+            if param.is_var_keyword:
+                has_kwargs = True
+        self.__dict__["has_kwargs"] = has_kwargs
         return parameters
 
     @cached_property
     def has_kwargs(self):
-        return any(p.kind is p.VAR_KEYWORD for p in self.parameters.values())
+        """Whether the command takes ``**kwargs``.
+
+        This is normally populated as a side effect of building
+        :attr:`parameters`. If it has been deleted since, it's computed
+        from the cached parameters.
+
+        """
+        parameters = self.parameters
+        has_kwargs = self.__dict__.get("has_kwargs")
+        if has_kwargs is None:
+            has_kwargs = any(p.is_var_keyword for p in parameters.values())
+        return has_kwargs
 
     @cached_property
     def args(self):
         """Create args from function parameters."""
         params = self.parameters
-        args = OrderedDict()
+        args = {}
 
         empty = Parameter.empty
 
@@ -1108,25 +1181,22 @@ class Command:
         get_inverse_short_option = self.get_inverse_short_option_for_arg
         get_inverse_long_option = self.get_inverse_long_option_for_arg
 
-        params = OrderedDict(
-            (
-                (normalize_name(n), p)
-                for n, p in params.items()
-                if not (
-                    n.startswith("_") or p.is_required_keyword_only or p.is_var_keyword
-                )
-            )
-        )
+        params = {
+            normalize_name(n): p
+            for n, p in params.items()
+            if not (n.startswith("_") or p.is_required_keyword_only or p.is_var_keyword)
+        }
+
+        arg_configs = {name: get_arg_config(param) for name, param in params.items()}
 
         used_short_options = set()
-        for param in params.values():
-            annotation = get_arg_config(param)
+        for annotation in arg_configs.values():
             short_option = annotation.short_option
             if short_option:
                 used_short_options.add(short_option)
 
         for name, param in params.items():
-            annotation = get_arg_config(param)
+            annotation = arg_configs[name]
             container = annotation.container
             type = annotation.type
             choices = annotation.choices
@@ -1197,21 +1267,26 @@ class Command:
         if "help" not in args:
             args["help"] = HelpArg(command=self)
 
-        option_map = OrderedDict()
+        # Build the option map used by self.option_map here, since all
+        # the options have to be visited anyway to check for collisions.
+        option_map = {}
+        collisions = {}
         for arg in args.values():
             for option in arg.options:
-                option_map.setdefault(option, [])
-                option_map[option].append(arg)
-
-        for option, option_args in option_map.items():
-            if len(option_args) > 1:
-                names = ", ".join(a.parameter.name for a in option_args)
-                message = (
-                    f"Option {option} of command {self.name} maps to "
-                    f"multiple parameters: {names}"
-                )
-                raise CommandError(message)
+                if option in option_map:
+                    collisions.setdefault(option, [option_map[option]]).append(arg)
+                else:
+                    option_map[option] = arg
+
+        for option, option_args in collisions.items():
+            names = ", ".join(a.parameter.name for a in option_args)
+            message = (
+                f"Option {option} of command {self.name} maps to "
+                f"multiple parameters: {names}"
+            )
+            raise CommandError(message)
 
+        self.__dict__["option_map"] = option_map
         return args
 
     @cached_property
@@ -1228,6 +1303,7 @@ class Command:
         )
 
         default_args = self.default_args
+        mutual_exclusion_groups = self.mutual_exclusion_groups
 
         for name, arg in self.args.items():
             if name == "help" and use_default_help:
@@ -1243,13 +1319,14 @@ class Command:
 
             mutual_exclusion_group_name = arg.mutual_exclusion_group
             if mutual_exclusion_group_name:
-                if mutual_exclusion_group_name not in self.mutual_exclusion_groups:
-                    self.mutual_exclusion_groups[
-                        mutual_exclusion_group_name
-                    ] = parser.add_mutually_exclusive_group()
-                mutual_exclusion_group = self.mutual_exclusion_groups[
+                mutual_exclusion_group = mutual_exclusion_groups.get(
                     mutual_exclusion_group_name
-                ]
+                )
+                if mutual_exclusion_group is None:
+                    mutual_exclusion_group = parser.add_mutually_exclusive_group()
+                    mutual_exclusion_groups[
+                        mutual_exclusion_group_name
+                    ] = mutual_exclusion_group
                 mutual_exclusion_group.add_argument(*options, **kwargs)
             else:
                 parser.add_argument(*options, **kwargs)
@@ -1264,7 +1341,19 @@ class Command:
     @cached_property
     def positionals(self):
         args = self.args.items()
-        return OrderedDict((name, arg) for (name, arg) in args if arg.is_positional)
+        return {name: arg for (name, arg) in args if arg.is_positional}
+
+    @cached_property
+    def positional_params(self):
+        """Parameter names and defaults of positionals, in order.
+
+        This is what :meth:`__call__` and :meth:`run` need to map
+        positional args, precomputed so they don't have to go through
+        each :class:`Arg` on every call.
+
+        """
+        args = self.positionals.values()
+        return tuple((arg.parameter.name, arg.default) for arg in args)
 
     @cached_property
     def var_positional(self):
@@ -1277,26 +1366,42 @@ class Command:
     @cached_property
     def optionals(self):
         args = self.args.items()
-        return OrderedDict((name, arg) for (name, arg) in args if arg.is_optional)
+        return {name: arg for (name, arg) in args if arg.is_optional}
 
     @cached_property
     def option_map(self):
-        """Map command-line options to args."""
-        option_map = OrderedDict()
-        for arg in self.args.values():
-            for option in arg.options:
-                option_map[option] = arg
+        """Map command-line options to args.
+
+        This is normally populated as a side effect of building
+        :attr:`args`. If it has been deleted since, it's rebuilt from
+        the cached args (which have already been checked for option
+        collisions).
+
+        """
+        args = self.args
+        option_map = self.__dict__.get("option_map")
+        if option_map is None:
+            option_map = {
+                option: arg for arg in args.values() for option in arg.options
+            }
         return option_map
 
-    @property
+    @cached_property
     def help(self):
+        """Help text, formatted once from :attr:`arg_parser`.
+
+        Like the parser itself, this reflects the command's args (and
+        their defaults) at the time it's first accessed.
+
+        """
         help_ = self.arg_parser.format_help()
         help_ = help_.split(": ", 1)[1]
         help_ = help_.strip()
         return help_
 
-    @property
+    @cached_property
     def usage(self):
+        """Usage text, formatted once from :attr:`arg_parser`."""
         usage = self.arg_parser.format_usage()
         usage = usage.split(": ", 1)[1]
         usage = usage.strip()
@@ -1312,6 +1417,30 @@ class Command:
         return f"Command(name={self.name})"
 
 
+@lru_cache(maxsize=4096)
+def _normalize_name(name):
+    # Chomp a single trailing underscore *if* the name ends with
+    # just one trailing underscore. This accommodates the convention
+    # of adding a trailing underscore to reserved/built-in names.
+    #
+    # NOTE: This is cached because it's called for every parameter of
+    #       every command and the same names (e.g., "echo", "hide")
+    #       tend to show up repeatedly.
+    if name.endswith("_"):
+        if name[-2] != "_":
+            name = name[:-1]
+    name = name.replace("_", "-")
+    return name
+
+
+@lru_cache(maxsize=4096)
+def _normalize_class_name(name):
+    name = camel_to_underscore(name)
+    name = name.replace("_", "-")
+    name = name.lower()
+    return name
+
+
 def command(
     name=None,
     description=None,
@@ -1380,3 +1509,36 @@ def subcommand(
         callbacks,
         cls,
     )
+
+
+def _config_file_cache_key(path):
+    """Get a key identifying the current version of a config file.
+
+    Returns ``None`` if the file doesn't exist (or isn't a file).
+
+    """
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    if not S_ISREG(stat_result.st_mode):
+        return None
+    return path, stat_result.st_mtime_ns, stat_result.st_size
+
+
+_cached_signature = lru_cache(maxsize=2048)(inspect.signature)
+
+
+def _get_signature(implementation):
+    # Signatures are immutable, so the same one can be shared by every
+    # command that wraps a given function (e.g., when a function is
+    # wrapped more than once or a command is copied). Unhashable
+    # callables skip the cache, as do bound methods, since caching
+    # them would keep their instances alive and they're only looked up
+    # once anyway (Command.parameters is cached per instance).
+    if inspect.ismethod(implementation):
+        return inspect.signature(implementation)
+    try:
+        return _cached_signature(implementation)
+    except TypeError:
+        return inspect.signature(implementation)
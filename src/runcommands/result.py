@@ -3,9 +3,11 @@ import shlex
 from subprocess import CompletedProcess
 from typing import Mapping
 
-from cached_property import cached_property
-
 from .exc import RunCommandsError
+from .util import cached_property
+
+_LINESEP = os.linesep
+_LINESEP_LEN = len(_LINESEP)
 
 
 class Result(RunCommandsError):
@@ -33,7 +35,7 @@ class Result(RunCommandsError):
         if isinstance(args, Mapping):
             return " ".join(f"{k} => {v}" for k, v in args.items())
         # XXX: Assume list, tuple, or some other kind of sequence
-        return " ".join(str(a) for a in args)
+        return " ".join(map(str, args))
 
     @cached_property
     def stdout_lines(self):
@@ -48,11 +50,10 @@ class Result(RunCommandsError):
 
     def __str__(self):
         output = (self.stderr if self.return_code else self.stdout) or "[NO OUTPUT]"
-        if output.endswith(os.linesep):
-            output = output[:-1]
+        if output.endswith(_LINESEP):
+            output = output[:-_LINESEP_LEN]
         status = "SUCCEEDED" if self.succeeded else "FAILED"
-        string = f"{status} ({self.return_code}): {self.args_str} -> {output}"
-        return string
+        return f"{status} ({self.return_code}): {self.args_str} -> {output}"
 
     def __repr__(self):
         return repr(str(self))
@@ -242,16 +242,12 @@ class Run(Command):
             runner.run(command_argv)
 
     def run(self, argv, **kwargs):
+        # NOTE: partition_argv() turns on debugging if -d or --debug is
+        #       found in the run args.
         all_argv, run_argv, command_argv = self.partition_argv(argv)
-        if "-d" in run_argv or "--debug" in run_argv:
-            self.debug = True
-        kwargs.update(
-            {
-                "all_argv": all_argv,
-                "run_argv": run_argv,
-                "command_argv": command_argv,
-            }
-        )
+        kwargs["all_argv"] = all_argv
+        kwargs["run_argv"] = run_argv
+        kwargs["command_argv"] = command_argv
         return super().run(run_argv, **kwargs)
 
     def console_script(self, argv=None, **overrides):
@@ -267,18 +263,16 @@ class Run(Command):
         if not argv:
             return argv, [], []
 
+        if not argv[0].startswith("-"):
+            # Fast path for the common case where there are no run
+            # options and commands start immediately.
+            return argv, [], argv
+
         # Consume all args that appear to be options (and their values,
         # if applicable), even those that aren't know run options, up
         # until the first non-option word is reached. That word is
         # assumed to be the start of commands.
 
-        def looks_like_option(s):
-            return bool(
-                (s.startswith("-") or s.startswith("--"))
-                and not s.startswith("---")
-                and s.strip("-")
-            )
-
         i = 0
         argc = len(argv)
         run_argv = []
@@ -310,7 +304,7 @@ class Run(Command):
                         run_argv.append(argv[j])
                         i = j
             else:
-                if not looks_like_option(a):
+                if not _looks_like_option(a):
                     # Non-option word; assumed to be start of commands.
                     break
 
@@ -361,19 +355,11 @@ class Run(Command):
                     raise RunnerError(
                         f"Commands module could not be imported: {commands_module}"
                     )
-        current_dir = Path(start_dir).resolve()
         candidates = ("runcommands.py", "commands.py")
-        for candidate in candidates:
-            candidate = current_dir / candidate
-            if candidate.is_file():
-                return module_from_path("commands", candidate)
-        if is_project_root(current_dir):
-            return None
-        root = current_dir.root
-        start_dir = current_dir.parent
-        if current_dir == root and start_dir == root:
+        commands_file = _find_file_upwards(start_dir, candidates)
+        if commands_file is None:
             return None
-        return self.find_commands_module(commands_module, start_dir)
+        return module_from_path("commands", commands_file)
 
     def find_config_file(self, config_file, start_dir="."):
         if config_file:
@@ -381,19 +367,8 @@ class Run(Command):
             if not os.path.exists(config_file):
                 raise RunnerError(f"Config file does not exists: {config_file}")
             return config_file
-        current_dir = Path(start_dir).resolve()
         candidates = ("runcommands.toml", "commands.toml", "pyproject.toml")
-        for candidate in candidates:
-            candidate = current_dir / candidate
-            if candidate.is_file():
-                return candidate
-        if is_project_root(current_dir):
-            return None
-        root = current_dir.root
-        start_dir = current_dir.parent
-        if current_dir == root and start_dir == root:
-            return None
-        return self.find_config_file(config_file, start_dir)
+        return _find_file_upwards(start_dir, candidates)
 
     def read_config_file(self, config_file, collection):
         return self._read_config_file(config_file, collection)
@@ -526,4 +501,30 @@ class Run(Command):
         raise RunAborted(0, message="\nAborted by Ctrl-C (SIGINT)")
 
 
+def _find_file_upwards(start_dir, candidates):
+    """Find the first candidate file in start dir or its ancestors.
+
+    The search stops after checking the project root or, if no project
+    root is found, the file system root.
+
+    """
+    current_dir = Path(start_dir).resolve()
+    while True:
+        for candidate in candidates:
+            candidate = current_dir / candidate
+            if candidate.is_file():
+                return candidate
+        if is_project_root(current_dir):
+            return None
+        parent = current_dir.parent
+        if parent == current_dir:
+            return None
+        current_dir = parent
+
+
+def _looks_like_option(s):
+    # NOTE: Checking for a single leading dash also covers "--".
+    return bool(s.startswith("-") and not s.startswith("---") and s.strip("-"))
+
+
 run = Run()
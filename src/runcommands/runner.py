@@ -131,16 +131,15 @@ class CommandToRun:
         # Ignore args after -- when determining whether help was
         # requested for a command because such args aren't command
         # options.
-        try:
-            dash_dash_index = argv.index("--")
-        except ValueError:
-            help_requested_argv = argv
-        else:
-            help_requested_argv = argv[:dash_dash_index]
-
-        self.help_requested = (
-            "-h" in help_requested_argv or "--help" in help_requested_argv
-        )
+        help_requested = False
+        for arg in argv:
+            if arg == "--":
+                break
+            if arg == "-h" or arg == "--help":
+                help_requested = True
+                break
+
+        self.help_requested = help_requested
 
     def run(self):
         return self.command.run(self.argv, _expand_short_options=False)
@@ -5,6 +5,7 @@ from .data import Data
 from .enums import Color, StreamOptions
 from .misc import (
     abort,
+    cached_property,
     flatten_args,
     format_if,
     is_mapping,
@@ -33,6 +34,7 @@ __all__ = [
     "Color",
     "StreamOptions",
     "abort",
+    "cached_property",
     "flatten_args",
     "format_if",
     "isatty",
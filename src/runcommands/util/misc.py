@@ -18,6 +18,52 @@ def abort(return_code=0, message="Aborted", color=True):
     raise RunAborted(return_code, message)
 
 
+class cached_property:
+
+    """Cache the value computed by a method on first access.
+
+    This works like :func:`functools.cached_property` but skips the
+    lock that it acquires on every first access. Commands are set up on
+    the main thread, so the lock only adds overhead.
+
+    The value is stored in the instance's ``__dict__``, which shadows
+    the property from then on. Delete the attribute to force the value
+    to be recomputed.
+
+    >>> class C:
+    ...     @cached_property
+    ...     def x(self):
+    ...         return object()
+    ...
+    >>> isinstance(C.x, cached_property)
+    True
+    >>> c = C()
+    >>> c.x is c.x
+    True
+    >>> 'x' in c.__dict__
+    True
+    >>> del c.x
+    >>> 'x' in c.__dict__
+    False
+
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
 def flatten_args(args: list, join=False, *, empty=(None, [], (), "")) -> list:
     """Flatten args and remove empty items.
 
@@ -1,6 +1,3 @@
-import re
-
-
 def camel_to_underscore(name):
     """Convert camel case name to underscore name.
 
@@ -34,12 +31,36 @@ def camel_to_underscore(name):
         '_request'
         >>> camel_to_underscore('Request_')
         'request_'
+        >>> camel_to_underscore('request')
+        'request'
 
     """
-    name = re.sub(r"(?<!\b)(?<!_)([A-Z][a-z])", r"_\1", name)
-    name = re.sub(r"(?<!\b)(?<!_)([a-z])([A-Z])", r"\1_\2", name)
-    name = name.lower()
-    return name
+    if name.islower():
+        # No upper case letters, so there's nothing to convert.
+        return name
+
+    # An underscore is inserted before an upper case letter that
+    # follows a letter or digit when either the next letter is lower
+    # case (the start of a word: "HttpRequest", "HTTPRequest") or the
+    # previous letter is lower case and isn't itself at the start of
+    # a word ("myHTTP").
+    chars = []
+    append = chars.append
+    last = len(name) - 1
+    prev = ""
+    for i, char in enumerate(name):
+        if "A" <= char <= "Z" and prev and prev != "_" and prev.isalnum():
+            if (i < last and "a" <= name[i + 1] <= "z") or (
+                "a" <= prev <= "z"
+                and i > 1
+                and name[i - 2] != "_"
+                and name[i - 2].isalnum()
+            ):
+                append("_")
+        append(char)
+        prev = char
+
+    return "".join(chars).lower()
 
 
 def invert_string(string):
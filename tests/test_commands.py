@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest import TestCase
 
 from runcommands import arg, command, subcommand
+from runcommands.command import Command
 from runcommands.commands import local
 from runcommands.exc import RunAborted
 from runcommands.result import Result
@@ -99,6 +100,54 @@ class TestLocalCommand(TestCase):
         self.assertTrue(result)
 
 
+class TestDescription(TestCase):
+    def test_one_line_docstring(self):
+        @command
+        def one_line():
+            """Do something."""
+
+        self.assertEqual(one_line.description, "Do something")
+
+    def test_no_docstring(self):
+        @command
+        def no_docstring():
+            pass
+
+        self.assertIsNone(no_docstring.description)
+
+    def test_method_docstring_is_dedented(self):
+        class ClassCommand(Command):
+            def implementation(self):
+                """Do something.
+
+                More details.
+
+                    Indented block.
+
+                """
+
+        cmd = ClassCommand()
+        self.assertEqual(cmd.short_description, "Do something")
+        self.assertEqual(
+            cmd.description, "Do something\n\nMore details.\n\n    Indented block."
+        )
+
+
+class TestExpandShortOptions(TestCase):
+    def test_no_multi_short_options(self):
+        argv = ["-E", "ls", "--cd", "/"]
+        self.assertIs(local.expand_short_options(argv), argv)
+
+    def test_multi_short_options(self):
+        argv = ["ls", "-Ec/tmp"]
+        expanded = local.expand_short_options(argv)
+        self.assertEqual(expanded, ["ls", "-E", "-c", "/tmp"])
+
+    def test_multi_short_options_after_double_dash(self):
+        argv = ["--", "-Ec/tmp"]
+        self.assertIs(local.expand_short_options(argv), argv)
+
+
 class TestCommandWithContainerArgs(SysExitMixin, TestCase):
     def test_positional(self):
         result = container_args.console_script(argv=["1"])
@@ -227,6 +276,19 @@ class TestSubcommand(SysExitMixin, TestCase):
         result = base1.console_script(argv=["-a", "A", "sub1", "--no-flag", "subsub1"])
         self.assertEqual(result, "subsub1(A, False)")
 
+    def test_call_subcommand_without_base_args_skips_base_arg_parser(self):
+        @command
+        def base2(cmd):
+            return MockResult(f"base2({cmd})")
+
+        @base2.subcommand
+        def sub2(a=None):
+            return MockResult(f"sub2({a})")
+
+        result = base2.console_script(argv=["sub2", "-a", "A"])
+        self.assertEqual(result, "sub2(A)")
+        self.assertNotIn("arg_parser", vars(base2))
+
 
 class TestSubcommandCallbacks(SysExitMixin, TestCase):
     def tearDown(self):
@@ -1,6 +1,8 @@
 import os
+import tempfile
 from unittest import TestCase
 
+from runcommands.args import arg
 from runcommands.collection import Collection
 from runcommands.command import command
 from runcommands.run import run
@@ -68,3 +70,83 @@ class TestConfig(TestCase):
         # Uses no default args
         result = runner.run(["test", "--a", "x", "--b", "y", "c", "-d", "z"])[0]
         self.assertEqual(("x", "y", "c", "z"), result)
+
+
+class TestConfigFileArgs(TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.temp_dir.cleanup()
+
+    def test_find_config_file_stops_at_file_system_root(self):
+        # The temp dir isn't in a project, so the search goes all the
+        # way up.
+        self.assertIsNone(run.find_config_file(None))
+
+    def test_read_args_from_setup_cfg(self):
+        with open("setup.cfg", "w") as fp:
+            fp.write("[standalone.args]\nn = 2\nname = ${n}x\nflag = true\n")
+            fp.write("[other]\nvalue = $unrelated\n")
+
+        @command(read_config=True)
+        def standalone(n=1, name=None, flag=False):
+            return n, name, flag
+
+        self.assertEqual(
+            {"n": 2, "name": "2x", "flag": True},
+            standalone.config_file_args,
+        )
+        self.assertEqual((2, "2x", True), standalone.run([]))
+
+    def test_changes_to_setup_cfg_are_picked_up(self):
+        def make_command():
+            @command(read_config=True)
+            def standalone(n=1):
+                return n
+
+            return standalone
+
+        with open("setup.cfg", "w") as fp:
+            fp.write("[standalone.args]\nn = 2\n")
+        self.assertEqual({"n": 2}, make_command().config_file_args)
+
+        with open("setup.cfg", "w") as fp:
+            fp.write("[standalone.args]\nn = 33\n")
+        self.assertEqual({"n": 33}, make_command().config_file_args)
+
+    def test_read_container_args_from_setup_cfg(self):
+        with open("setup.cfg", "w") as fp:
+            fp.write("[standalone.args]\nnames = a b\n  c\nsizes = a:1 b:2\n")
+
+        @command(read_config=True)
+        def standalone(
+            names: arg(container=list) = None,
+            sizes: arg(container=dict, type=int) = None,
+        ):
+            return names, sizes
+
+        self.assertEqual(
+            {"names": ["a", "b", "c"], "sizes": {"a": 1, "b": 2}},
+            standalone.config_file_args,
+        )
+
+    def test_container_args_from_pyproject_toml_are_not_split(self):
+        # TOML has arrays, so strings are left as is.
+        with open("pyproject.toml", "w") as fp:
+            fp.write('[tool.standalone.args]\nnames = "a b"\nsizes = ["a", "b"]\n')
+
+        @command(read_config=True)
+        def standalone(
+            names: arg(container=list) = None,
+            sizes: arg(container=list) = None,
+        ):
+            return names, sizes
+
+        self.assertEqual(
+            {"names": "a b", "sizes": ["a", "b"]},
+            standalone.config_file_args,
+        )